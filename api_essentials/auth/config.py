@@ -1,6 +1,6 @@
 import logging
 from dataclasses import dataclass
-from typing import Optional, List, Union, Type
+from typing import Any, Optional, List, Tuple, Union, Type
 
 import httpx
 from httpx import URL, AsyncClient, Client
@@ -118,6 +118,8 @@ class OAuth2Config:
         self._scope_strategy = scope_strategy
         self._grant_type = grant_type
         self._response_type = response_type
+        # (scopes, strategy, delimiter) -> merged scope string, see the scope property
+        self._scope_cache: Tuple[Optional[Tuple[Any, ...]], str] = (None, "")
 
         self.__post_init__()
 
@@ -135,10 +137,20 @@ class OAuth2Config:
         :return: The scope as a single string (order preserved, deduplicated).
         """
         scopes: List[str] = self._scope or []
+        strategy = self.scope_strategy
+        # The scope is read on every token request but rarely changes. Keying the
+        # cached string on the inputs keeps it correct even when _scope is mutated
+        # in place or the strategy's delimiter changes.
+        key = (tuple(scopes), strategy, strategy.delimiter)
+        cached_key, cached = self._scope_cache
+        if key == cached_key:
+            return cached
         # Order-preserving deduplication
         seen = set()
         scopes_deduped = [x for x in scopes if not (x in seen or seen.add(x))]
-        return self.scope_strategy.merge_scopes(scopes_deduped)
+        merged = strategy.merge_scopes(scopes_deduped)
+        self._scope_cache = (key, merged)
+        return merged
 
     def set_scope(self, value: Union[str, List[str]]) -> None:
         """
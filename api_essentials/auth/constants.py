@@ -4,3 +4,5 @@ AUTH_REDIRECTS = os.getenv("AUTH_REDIRECTS", 10)
 AUTH_TIMEOUT = os.getenv("AUTH_TIMEOUT", 6)
 SSL_VERIFICATION = os.getenv("AUTH_SSL_VERIFICATION", True)
 TOKEN_GRACE_PERIOD = os.getenv("AUTH_TOKEN_GRACE_PERIOD", 60)
+TOKEN_PREFETCH_WINDOW = int(os.getenv("AUTH_TOKEN_PREFETCH_WINDOW", 60))
+TOKEN_PREFETCH_RETRY_DELAY = int(os.getenv("AUTH_TOKEN_PREFETCH_RETRY_DELAY", 15))
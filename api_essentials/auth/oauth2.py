@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import time
 import typing
 from typing import TYPE_CHECKING, Generator, AsyncGenerator
 
@@ -7,6 +9,7 @@ from httpx import Auth, Request, Response
 from enum import Enum
 
 from api_essentials.utils.log import register_secret, setup_secret_filter
+from .constants import TOKEN_PREFETCH_RETRY_DELAY, TOKEN_PREFETCH_WINDOW
 from .token import OAuth2Token
 
 if TYPE_CHECKING:
@@ -14,6 +17,8 @@ if TYPE_CHECKING:
 
 ClientType = typing.Union[httpx.Client, httpx.AsyncClient]
 
+_CONTENT_TYPE_JSON = "application/json"
+
 class OAuth2ResponseType(Enum):
     """
     Enum to represent the OAuth2 response types.
@@ -35,6 +40,12 @@ class BaseOAuth2(BaseAuth):
 
         self.config: "OAuth2Config" = config
         self.logger: logging.Logger = logging.getLogger(__name__)
+        # Token the cached Authorization header was built for, and the header itself.
+        self._bearer_cache: typing.Tuple[typing.Optional[OAuth2Token], str] = (None, "")
+        # In-flight background token refresh started by the async auth flow.
+        self._refresh_task: typing.Optional[asyncio.Task] = None
+        # Monotonic time of the last failed background refresh, for backoff.
+        self._prefetch_failed_at: typing.Optional[float] = None
         self.logger.debug("BaseOAuth2 initialized with config: %s", config)
 
     def sync_auth_flow(
@@ -49,9 +60,12 @@ class BaseOAuth2(BaseAuth):
         Raises:
             RuntimeError: If the token acquisition fails.
         """
-        self.logger.debug("Starting OAuth2 sync auth flow with request: %s", request)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Starting OAuth2 sync auth flow with request: %s", request)
         request = self._setup_auth_flow(request)
-        self.logger.debug("Yielding request in sync auth flow: %s", request)
+        if debug:
+            self.logger.debug("Yielding request in sync auth flow: %s", request)
         yield request
 
     async def async_auth_flow(
@@ -67,9 +81,20 @@ class BaseOAuth2(BaseAuth):
         Raises:
             RuntimeError: If the token acquisition fails.
         """
-        self.logger.debug("Starting OAuth2 async auth flow with request: %s", request)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Starting OAuth2 async auth flow with request: %s", request)
+        task = self._refresh_task
+        if task is not None:
+            token: typing.Optional[OAuth2Token] = self.config.access_token
+            if token is None or not token.is_valid:
+                # Use the refresh already in flight instead of fetching in parallel.
+                # asyncio.wait neither raises its errors nor cancels it with us.
+                await asyncio.wait((task,))
         request = self._setup_auth_flow(request)
-        self.logger.debug("Yielding request in async auth flow: %s", request)
+        self._schedule_prefetch()
+        if debug:
+            self.logger.debug("Yielding request in async auth flow: %s", request)
         yield request
 
     def _setup_auth_flow(self, request: httpx.Request) -> httpx.Request:
@@ -83,21 +108,43 @@ class BaseOAuth2(BaseAuth):
         Raises:
             RuntimeError: If the token acquisition fails.
         """
-        self.logger.debug("Setting up OAuth2 auth flow for request: %s", request)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Setting up OAuth2 auth flow for request: %s", request)
         try:
             token: OAuth2Token = self._get_token()
-            self.logger.debug("Obtained token: %s", token)
+            if debug:
+                self.logger.debug("Obtained token: %s", token)
         except AttributeError:
             self.logger.error("AttributeError encountered during token acquisition.")
             raise
         except Exception as e:
             self.logger.error("Failed to get OAuth2 token: %s", str(e))
             raise RuntimeError("Failed to get OAuth2 token.") from e
-        request.headers["Authorization"] = f"Bearer {token.access_token}"
-        request.headers["Content-Type"] = "application/json"
-        self.logger.debug("Request headers updated for OAuth2 auth flow: %s", request.headers)
+        request.headers["Authorization"] = self._bearer_header(token)
+        request.headers.setdefault("Content-Type", _CONTENT_TYPE_JSON)
+        if debug:
+            self.logger.debug("Request headers updated for OAuth2 auth flow: %s", request.headers)
         return request
 
+    def _bearer_header(self, token: OAuth2Token) -> str:
+        """
+        Get the Authorization header value for the token.
+
+        The formatted header is cached for as long as the same token instance is
+        returned, so repeated requests reuse a single string.
+
+        Arguments:
+            token (OAuth2Token): The token to build the header for.
+        Returns:
+            str: The Authorization header value.
+        """
+        cached_token, header = self._bearer_cache
+        if cached_token is not token:
+            header = f"Bearer {token.access_token}"
+            self._bearer_cache = (token, header)
+        return header
+
     def _get_token(self) -> "OAuth2Token":
         """
         Get the access token for the OAuth2 configuration.
@@ -111,26 +158,100 @@ class BaseOAuth2(BaseAuth):
         """
         config: OAuth2Config = self.config
         access_token: OAuth2Token = config.access_token
-        refresh_token: OAuth2Token = config.refresh_token
 
         # Check if the token is expired
         if access_token and access_token.is_valid:
-            self.logger.debug("Access token is valid.")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Access token is valid.")
             return access_token
 
-        # If the token is expired, refresh it
+        self.logger.debug("Access token is expired.")
+        return self._fetch_token()
+
+    def _fetch_token(self) -> "OAuth2Token":
+        """
+        Obtain a fresh token from the token endpoint, ignoring any cached access token.
+
+        Arguments:
+            None
+        Returns:
+            OAuth2Token: The new token.
+        Raises:
+            RuntimeError: If no token class is provided or if the token acquisition fails.
+        """
+        config: OAuth2Config = self.config
+        access_token: OAuth2Token = config.access_token
+        refresh_token: OAuth2Token = config.refresh_token
+
         if refresh_token and refresh_token.is_valid:
-            self.logger.debug("Access token is expired, refreshing token.")
+            self.logger.debug("Refreshing token.")
             return refresh_token.refresh(config)
 
-        self.logger.debug("Access token is expired, requesting new token.")
+        self.logger.debug("Requesting new token.")
         if access_token:
             return access_token.request_new(config)
 
         if config.token_class is not None:
-            self.logger.debug("Requesting new token.")
             return config.token_class.request_new(config)
         else:
             self.logger.error("No token class provided.")
             raise RuntimeError("No token class provided.")
 
+    def _schedule_prefetch(self) -> None:
+        """
+        Start refreshing the access token in the background when it is about to expire.
+
+        Runs from the async auth flow only. When the configured access token is
+        still valid but will be treated as expired within TOKEN_PREFETCH_WINDOW
+        seconds, a new token is fetched in a worker thread and stored on the
+        config, so later requests keep hitting the valid-token branch instead of
+        waiting on the token endpoint. Configs with an attached client are
+        skipped, so the worker thread always uses a private client. At most
+        one refresh runs at a time, and after a failure none is started for
+        TOKEN_PREFETCH_RETRY_DELAY seconds.
+        """
+        if self._refresh_task is not None:
+            return
+        # Token requests temporarily swap BasicAuth onto an attached client. Doing
+        # that from a worker thread would race with requests sent meanwhile.
+        if self.config.client is not None:
+            return
+        failed_at = self._prefetch_failed_at
+        if failed_at is not None and time.monotonic() - failed_at < TOKEN_PREFETCH_RETRY_DELAY:
+            return
+        token: typing.Optional[OAuth2Token] = self.config.access_token
+        remaining = token.seconds_until_expiry if token is not None else None
+        if remaining is None or not 0 < remaining < TOKEN_PREFETCH_WINDOW:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not on asyncio (e.g. httpx under trio); the request path refreshes instead.
+            return
+        self.logger.debug("Access token expires in %.0f seconds, refreshing in the background.", remaining)
+        self._refresh_task = loop.create_task(self._prefetch_token())
+        self._refresh_task.add_done_callback(self._on_prefetch_done)
+
+    async def _prefetch_token(self) -> None:
+        """
+        Fetch a new token off the event loop and store it on the config.
+        """
+        token: OAuth2Token = await asyncio.to_thread(self._fetch_token)
+        self.config.access_token = token
+        self.logger.debug("Background token refresh completed.")
+
+    def _on_prefetch_done(self, task: asyncio.Task) -> None:
+        """
+        Clear the in-flight refresh and log its failure, if any.
+
+        A failed prefetch is not fatal: the current token stays in place and the
+        request path fetches a new one once it expires. The failure time is
+        recorded so an unavailable token endpoint is not retried on every request.
+        """
+        self._refresh_task = None
+        if not task.cancelled() and task.exception() is not None:
+            self._prefetch_failed_at = time.monotonic()
+            self.logger.error("Background token refresh failed: %s", str(task.exception()))
+        else:
+            self._prefetch_failed_at = None
+
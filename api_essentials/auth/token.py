@@ -1,11 +1,13 @@
 import logging
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Optional, List, Dict, Any, Protocol
 
 from httpx import URL, BasicAuth, Auth, Client, Response, HTTPStatusError, Request, RequestError
 
+from api_essentials.utils.serialization import dumps, loads
 from .constants import TOKEN_GRACE_PERIOD
 from .grant_type import OAuth2GrantType
 from .exceptions import OAuth2TokenExpired, OAuth2TokenInvalid, OAuth2TokenRevoked
@@ -24,6 +26,15 @@ class OAuthTokenType(Enum):
     REFRESH = "refresh"
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Enum lookups used on every token request/parse, resolved once at import time.
+_TOKEN_TYPES_BY_VALUE: Dict[str, OAuthTokenType] = {m.value: m for m in OAuthTokenType}
+_GRANT_TYPES_BY_VALUE: Dict[str, OAuth2GrantType] = {m.value: m for m in OAuth2GrantType}
+_GRANT_TYPE_CLIENT_CREDENTIALS: str = OAuth2GrantType.CLIENT_CREDENTIALS.value
+_GRANT_TYPE_REFRESH_TOKEN: str = OAuth2GrantType.REFRESH_TOKEN.value
+
+
 class OAuth2ConfigProtocol(Protocol):
     """
     Protocol for OAuth2 configuration. Any config passed to `request_new` or `refresh`
@@ -122,7 +133,7 @@ class _TokenRequestHelper:
             )
             response: Response = client.post(str(token_url), data=payload)
             response.raise_for_status()
-            token_data = response.json()
+            token_data = loads(response.content)
             logger.debug("Token endpoint response data: %s", token_data)
             return token_data
         except HTTPStatusError as http_err:
@@ -137,7 +148,7 @@ class _TokenRequestHelper:
             _TokenRequestHelper._finalize_client(client, original_auth, used_existing_client)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OAuth2Token:
     """
     Immutable data class representing an OAuth2 token.
@@ -161,6 +172,9 @@ class OAuth2Token:
         default_factory=lambda: logger, repr=False
     )
     grace_period: Optional[int] = TOKEN_GRACE_PERIOD
+    # Derived once in __post_init__; the token is immutable so these never go stale.
+    _expires_at: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _expiry_deadline_ns: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """
@@ -187,19 +201,57 @@ class OAuth2Token:
             self.logger.warning("created_at is naive; assuming UTC timezone.")
             object.__setattr__(self, "created_at", self.created_at.replace(tzinfo=timezone.utc))
 
+        self._compute_expiry()
+
+    def _compute_expiry(self) -> None:
+        """
+        Derive expires_at and the wall-clock expiry deadline from the token fields.
+        """
+        if self.expires_in is None or not self.created_at:
+            object.__setattr__(self, "_expires_at", None)
+            object.__setattr__(self, "_expiry_deadline_ns", None)
+            return
+        expires_at = self.created_at + timedelta(seconds=self.expires_in)
+        # Convert the grace-adjusted cutoff to epoch nanoseconds once, so expiry
+        # checks are an integer comparison against time.time_ns(). A wall clock
+        # (unlike the monotonic one) keeps counting while the machine is suspended.
+        since_epoch = expires_at - timedelta(seconds=self.grace_period or 0) - _EPOCH
+        deadline_ns = (since_epoch.days * 86_400 + since_epoch.seconds) * 1_000_000_000 + since_epoch.microseconds * 1_000
+        object.__setattr__(self, "_expires_at", expires_at)
+        object.__setattr__(self, "_expiry_deadline_ns", deadline_ns)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle only the declared fields; the derived expiry fields are rebuilt in
+        __setstate__ rather than stored.
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the declared fields and recompute the expiry deadline.
+        """
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self._compute_expiry()
+
     @property
     def expires_at(self) -> Optional[datetime]:
         """
-        Compute the absolute expiration datetime based on created_at + expires_in.
+        The absolute expiration datetime, created_at + expires_in.
         Returns None if expires_in is None.
         """
-        if self.expires_in is None:
-            self.logger.debug("expires_in is None; expires_at is None.")
-            return None
+        return self._expires_at
 
-        expiration = self.created_at + timedelta(seconds=self.expires_in)
-        self.logger.debug("Computed expires_at: %s", expiration)
-        return expiration
+    @property
+    def seconds_until_expiry(self) -> Optional[float]:
+        """
+        Seconds left until the token is treated as expired, grace period included.
+        Negative once expired; None if the expiry is unknown.
+        """
+        if self._expiry_deadline_ns is None:
+            return None
+        return (self._expiry_deadline_ns - time.time_ns()) / 1_000_000_000
 
     @property
     def is_expired(self) -> bool:
@@ -207,16 +259,17 @@ class OAuth2Token:
         Determine if the token is expired or within its grace period.
         If expires_at is None, treat as expired (cannot verify).
         """
-        exp = self.expires_at
-        if exp is None:
-            self.logger.debug("expires_at is None; treating token as expired.")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        deadline = self._expiry_deadline_ns
+        if deadline is None:
+            if debug:
+                self.logger.debug("expires_at is None; treating token as expired.")
             return True
 
-        # Subtract grace period
-        cutoff = exp - timedelta(seconds=self.grace_period or 0)
-        now = datetime.now(tz=timezone.utc)
-        expired = now > cutoff
-        self.logger.debug("Token expiration check: now=%s, cutoff=%s, expired=%s", now, cutoff, expired)
+        now = time.time_ns()
+        expired = now > deadline
+        if debug:
+            self.logger.debug("Token expiration check: now=%s, deadline=%s, expired=%s", now, deadline, expired)
         return expired
 
     @property
@@ -224,15 +277,19 @@ class OAuth2Token:
         """
         A token is valid if it has a non-empty access_token and is not expired.
         """
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         if not self.access_token:
-            self.logger.debug("is_valid: access_token is empty -> invalid.")
+            if debug:
+                self.logger.debug("is_valid: access_token is empty -> invalid.")
             return False
 
         if self.is_expired:
-            self.logger.debug("is_valid: token is expired -> invalid.")
+            if debug:
+                self.logger.debug("is_valid: token is expired -> invalid.")
             return False
 
-        self.logger.debug("is_valid: token is valid.")
+        if debug:
+            self.logger.debug("is_valid: token is valid.")
         return True
 
     @property
@@ -275,7 +332,7 @@ class OAuth2Token:
 
         self.logger.debug("Refreshing token via refresh_token grant.")
         payload: Dict[str, Any] = {
-            "grant_type": "refresh_token",
+            "grant_type": _GRANT_TYPE_REFRESH_TOKEN,
             "refresh_token": self.refresh_token,
         }
         if config.scope:
@@ -307,7 +364,7 @@ class OAuth2Token:
                              config.grant_type, config.scope)
 
         payload: Dict[str, Any] = {
-            "grant_type": getattr(config, "grant_type", str(OAuth2GrantType.CLIENT_CREDENTIALS)),
+            "grant_type": getattr(config, "grant_type", _GRANT_TYPE_CLIENT_CREDENTIALS),
         }
         if config.scope:
             payload["scope"] = config.scope
@@ -352,19 +409,13 @@ class OAuth2Token:
         raw_type = data.get("token_type")
         token_type = None
         if isinstance(raw_type, str):
-            try:
-                token_type = OAuthTokenType(raw_type)
-            except ValueError:
-                token_type = OAuthTokenType.ACCESS
+            token_type = _TOKEN_TYPES_BY_VALUE.get(raw_type, OAuthTokenType.ACCESS)
 
         # Parse grant_type
         raw_grant = data.get("grant_type")
         grant_type = None
         if isinstance(raw_grant, str):
-            try:
-                grant_type = OAuth2GrantType(raw_grant)
-            except ValueError:
-                grant_type = None
+            grant_type = _GRANT_TYPES_BY_VALUE.get(raw_grant)
 
         # Parse created_at
         created_at_raw = data.get("created_at")
@@ -419,6 +470,7 @@ class RiskAnalyticsToken(OAuth2Token):
     Specialized token class for Risk Analytics. Implements a JSON-based token request
     that does not use client credentials in form data but in JSON with NoAuth.
     """
+    __slots__ = ()
 
     @classmethod
     def request_new(cls, config: OAuth2ConfigProtocol) -> "RiskAnalyticsToken":
@@ -444,13 +496,13 @@ class RiskAnalyticsToken(OAuth2Token):
             method="POST",
             url=str(config.token_url),
             headers={"Content-Type": "application/json", "Accept": "application/json"},
-            json=json_payload
+            content=dumps(json_payload)
         )
 
         try:
             response: Response = config.client.send(request, auth=NoAuth())
             response.raise_for_status()
-            token_data = response.json()
+            token_data = loads(response.content)
             ra_logger.debug("Received RiskAnalyticsToken data: %s", token_data)
         except HTTPStatusError as http_err:
             status = http_err.response.status_code
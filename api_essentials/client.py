@@ -1,34 +1,86 @@
 import logging
-from typing import Optional, Dict
+from typing import Optional, Dict, Hashable
 
-from httpx import Client
+from httpx import Client, Headers, Limits
 
 from .auth.config import OAuth2Config
 from .auth.oauth2 import BaseOAuth2
 from api_essentials.models.request.request_id import RequestId
 from .models.request import Request
 from .models.response import Response
+from .strategy.strategies.cache import ResponseCache
+from .strategy.strategies.coalesce import RequestCoalescer
 from .strategy.strategies.ratelimit import RateLimit
+from .utils.serialization import dumps, loads
 
 class RateLimitExceeded(Exception):
     """Raised when the API client rate limit is exceeded."""
     pass
 
+# Idempotent methods whose responses may be cached or shared between concurrent callers.
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+
 class APIClient:
     """
     Unified API client with OAuth2 authentication and automatic request ID injection.
     """
-    def __init__(self, config: OAuth2Config, base_url: Optional[str] = None, *, max_requests: int = 100, time_window: int = 60, **client_kwargs):
+    def __init__(
+        self,
+        config: OAuth2Config,
+        base_url: Optional[str] = None,
+        *,
+        max_requests: int = 100,
+        time_window: int = 60,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 100,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        **client_kwargs
+    ):
+        """
+        Initialize the API client.
+
+        Args:
+            config (OAuth2Config): The OAuth2 configuration used to authenticate requests.
+            base_url (Optional[str]): Base URL for all requests. Defaults to the token URL.
+            max_requests (int): Maximum number of requests allowed in the rate limit window.
+            time_window (int): Rate limit window in seconds.
+            max_connections (int): Maximum number of concurrent connections in the pool.
+            max_keepalive_connections (int): Maximum number of idle connections kept open for reuse.
+            keepalive_expiry (float): Seconds an idle connection is kept open.
+            http2 (bool): Enable HTTP/2. Requires the ``h2`` package (``httpx[http2]``).
+            cache (Optional[ResponseCache]): Cache for successful GET and HEAD responses.
+                Cache hits skip both the network and the rate limit. Disabled by default.
+            coalesce_requests (bool): Share one in-flight GET or HEAD between threads making
+                the identical request at the same time. Disabled by default.
+            **client_kwargs: Additional keyword arguments for httpx.Client. An explicit
+                ``limits`` argument takes precedence over the pool settings above.
+        """
         self.logger = logging.getLogger(__name__)
         self.config = config
         self.auth = BaseOAuth2(config)
         self.base_url = base_url or (str(config.token_url) if hasattr(config, 'token_url') else None)
-        self.client = Client(base_url=self.base_url, auth=self.auth, **client_kwargs)
+        client_kwargs.setdefault("limits", Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ))
+        self.client = Client(base_url=self.base_url, auth=self.auth, http2=http2, **client_kwargs)
         self.ratelimit = RateLimit(max_requests=max_requests, time_window=time_window)
+        self.cache = cache
+        self.coalescer = RequestCoalescer() if coalesce_requests else None
 
     def _build_request(self, method: str, url: str, **kwargs) -> Request:
-        headers = kwargs.pop("headers", {})
-        self.logger.debug("Building request: %s %s headers=%s kwargs=%s", method, url, headers, kwargs)
+        headers = Headers(kwargs.pop("headers", None))
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            # Like httpx's json=, keep a Content-Type the caller chose (e.g. merge-patch)
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["content"] = dumps(payload)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Building request: %s %s headers=%s kwargs=%s", method, url, headers, kwargs)
         return Request(method=method, url=url, headers=headers, **kwargs)
 
     def _check_rate_limit(self):
@@ -41,6 +93,10 @@ class APIClient:
         """
         Make an API request with automatic request ID injection and rate limiting.
 
+        When a response cache is configured, successful GET and HEAD responses
+        are served from it until they expire. With request coalescing enabled,
+        concurrent identical GET and HEAD requests share a single round trip.
+
         Args:
             method (str): HTTP method (GET, POST, PUT, DELETE).
             url (str): The URL to send the request to.
@@ -49,14 +105,43 @@ class APIClient:
         Returns:
             Response: The response from the API.
         """
-        self._check_rate_limit()
         request = self._build_request(method, url, **kwargs)
-        response = self.client.request(request.method, request.url, headers=request.headers)
+        if request.method not in CACHEABLE_METHODS or (self.cache is None and self.coalescer is None):
+            self._check_rate_limit()
+            return self._send(request)
+
+        key = self._request_key(request)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.logger.debug("Serving %s %s from the response cache.", request.method, request.url)
+                return cached
+        if self.coalescer is not None:
+            return self.coalescer.run(key, lambda: self._fetch(key, request))
+        return self._fetch(key, request)
+
+    @staticmethod
+    def _request_key(request: Request) -> Hashable:
+        return request.method, str(request.url), tuple(request.headers.multi_items())
+
+    def _fetch(self, key: Hashable, request: Request) -> Response:
+        self._check_rate_limit()
+        response = self._send(request)
+        if self.cache is not None and response.is_success:
+            self.cache.set(key, response)
+        return response
+
+    def _send(self, request: Request) -> Response:
+        # Load streaming bodies (files=, generators) so .content is available
+        content = request.read()
+        response = self.client.request(
+            request.method, request.url, headers=request.headers, content=content or None
+        )
         return Response(
             status_code=response.status_code,
             headers=response.headers,
             content=response.content,
-            json=response.json() if response.headers.get("Content-Type") == "application/json" else None
+            json=loads(response.content) if response.headers.get("Content-Type") == "application/json" else None
         )
 
     def get(self, url: str, **kwargs) -> Response:
@@ -83,11 +83,22 @@ class RequestId:
     def __get__(self, instance: Optional[Any], owner: type) -> uuid.UUID:
         if instance is None:
             return self._descriptor_uuid
-        if not hasattr(instance, self._private_name):
-            new_id = self._generate_id()
-            setattr(instance, self._private_name, new_id)
-            logger.debug("[RequestId] Generated new ID for %s: %s", instance, new_id)
-        return getattr(instance, self._private_name)
+        # One dict lookup on the hot path instead of hasattr() followed by getattr();
+        # owners using __slots__ without a __dict__ go through getattr/setattr.
+        instance_dict = getattr(instance, "__dict__", None)
+        if instance_dict is not None:
+            request_id = instance_dict.get(self._private_name)
+        else:
+            request_id = getattr(instance, self._private_name, None)
+        if request_id is None:
+            request_id = self._generate_id()
+            if instance_dict is not None:
+                instance_dict[self._private_name] = request_id
+            else:
+                setattr(instance, self._private_name, request_id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[RequestId] Generated new ID for %s: %s", instance, request_id)
+        return request_id
 
     def __set__(self, instance: Any, value: Any) -> None:
         raise AttributeError("Cannot set request ID directly.")
@@ -141,5 +152,8 @@ class RequestId:
         return not self.__eq__(other)
 
     def _reset(self, instance: Any) -> None:
-        if hasattr(instance, self._private_name):
+        instance_dict = getattr(instance, "__dict__", None)
+        if instance_dict is not None:
+            instance_dict.pop(self._private_name, None)
+        elif hasattr(instance, self._private_name):
             delattr(instance, self._private_name)
@@ -0,0 +1,133 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable, Optional, Tuple
+
+import httpx
+
+from api_essentials.strategy.interface import Strategy
+
+
+class CacheStrategyProtocol(Strategy):
+    """
+    Protocol for response cache strategies.
+    """
+    def get(self, key: Hashable) -> Optional[httpx.Response]:
+        """
+        Get a cached response, or None if there is no fresh entry.
+        """
+        pass
+
+    def set(self, key: Hashable, response: httpx.Response) -> None:
+        """
+        Store a response in the cache.
+        """
+        pass
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+        pass
+
+
+class ResponseCache(CacheStrategyProtocol):
+    """
+    In-memory LRU cache for responses to idempotent requests, with per-entry expiry.
+    """
+    def __init__(self, ttl: float, max_entries: int = 256) -> None:
+        """
+        Initialize the response cache.
+
+        Attributes:
+            ttl (float): Default time to live for an entry in seconds. A
+                ``Cache-Control: max-age`` on the response takes precedence.
+            max_entries (int): Maximum number of cached responses. The least
+                recently used entry is evicted when the cache is full.
+        Raises:
+            ValueError: If ttl or max_entries is less than or equal to 0.
+        """
+        super().__init__()
+        self._validate(ttl, max_entries)
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, httpx.Response]]" = OrderedDict()
+        self._lock = Lock()
+
+    def _validate(self, ttl: float, max_entries: int) -> None:
+        """
+        Validate the cache parameters.
+
+        Attributes:
+            ttl (float): Default time to live for an entry in seconds.
+            max_entries (int): Maximum number of cached responses.
+        Raises:
+            ValueError: If ttl or max_entries is less than or equal to 0.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+
+    def get(self, key: Hashable) -> Optional[httpx.Response]:
+        """
+        Get a cached response.
+
+        Returns:
+            Optional[httpx.Response]: The cached response, or None if the key is
+                missing or its entry has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: Hashable, response: httpx.Response) -> None:
+        """
+        Store a response in the cache.
+
+        Responses marked ``Cache-Control: no-store`` or ``max-age=0`` are not stored.
+        """
+        ttl = self._ttl_for(response)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _ttl_for(self, response: httpx.Response) -> float:
+        """
+        Get the time to live for a response from its Cache-Control header.
+
+        Returns:
+            float: ``max-age`` if present, 0 for ``no-store``/``no-cache``, else the default ttl.
+        """
+        cache_control = response.headers.get("Cache-Control")
+        if not cache_control:
+            return self.ttl
+        directives = [directive.strip() for directive in cache_control.lower().split(",")]
+        # no-store/no-cache win regardless of where they appear
+        if "no-store" in directives or "no-cache" in directives:
+            return 0
+        for directive in directives:
+            if directive.startswith("max-age="):
+                try:
+                    return float(directive[len("max-age="):])
+                except ValueError:
+                    return self.ttl
+        return self.ttl
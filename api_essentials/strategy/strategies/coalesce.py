@@ -0,0 +1,71 @@
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from api_essentials.strategy.interface import Strategy
+
+T = TypeVar("T")
+
+
+class CoalesceStrategyProtocol(Strategy):
+    """
+    Protocol for request coalescing strategies.
+    """
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run fn, sharing its result with concurrent callers using the same key.
+        """
+        raise NotImplementedError
+
+
+class RequestCoalescer(CoalesceStrategyProtocol):
+    """
+    Single-flight request coalescing.
+
+    While a call for a key is in progress, other threads calling ``run`` with the
+    same key wait for it and receive its result (or exception) instead of
+    starting their own. Once the call completes the key is released, so later
+    callers trigger a new call.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize the request coalescer.
+        """
+        super().__init__()
+        self._inflight: Dict[Hashable, "Future[Any]"] = {}
+        self._lock = Lock()
+
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run fn, or wait for an in-flight call with the same key.
+
+        Arguments:
+            key (Hashable): Identifies equivalent calls.
+            fn (Callable[[], T]): The call to make if none is in flight.
+        Returns:
+            T: The result of fn.
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller.
+        """
+        with self._lock:
+            inflight: "Optional[Future[T]]" = self._inflight.get(key)
+            if inflight is not None:
+                leader = False
+                future = inflight
+            else:
+                leader = True
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
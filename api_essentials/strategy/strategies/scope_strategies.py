@@ -1,7 +1,7 @@
 import os
 from dataclasses import dataclass
 from enum import Enum, IntEnum, auto
-from typing import List, Union, Any
+from typing import Any, Callable, Iterable, List, Union
 
 from api_essentials.strategy.interface import SimpleStrategy
 
@@ -33,6 +33,13 @@ class ScopeStrategy(SimpleStrategy):
     Base class for scope strategies.
     """
     _delimiter: str
+    _join: Callable[[Iterable[str]], str]
+
+    # Looked up by name so subclasses overriding split_scopes/merge_scopes are honored.
+    _DISPATCH = {
+        ScopeExecutionMode.SPLIT: "split_scopes",
+        ScopeExecutionMode.MERGE: "merge_scopes",
+    }
 
     def __init__(self, delimiter: str) -> None:
         """
@@ -77,6 +84,7 @@ class ScopeStrategy(SimpleStrategy):
         if len(value) > DELIMITER_MAX_LENGTH:
             raise ScopeStrategyError("Delimiter must be a single character.")
         self._delimiter = value
+        self._join = value.join
 
     def split_scopes(self, scopes: str) -> List[str]:
         """
@@ -100,7 +108,7 @@ class ScopeStrategy(SimpleStrategy):
         if len(scopes) > SCOPE_LENGTH_BACKSTOP:
             raise ScopeStrategyError("Scopes string is too long.")
         try:
-            return scopes.split(self.delimiter)
+            return scopes.split(self._delimiter)
         except AttributeError as e:
             raise ScopeStrategyExecutionError(f"Error splitting scopes: {e}.") from e
 
@@ -129,8 +137,8 @@ class ScopeStrategy(SimpleStrategy):
             raise ScopeStrategyError("All scopes must be strings.")
 
         try:
-            # Remove duplicates and join with the delimiter
-            return self.delimiter.join(set(scopes))
+            # Remove duplicates (keeping first-seen order) and join with the delimiter
+            return self._join(dict.fromkeys(scopes))
         except AttributeError as e:
             raise ScopeStrategyExecutionError(f"Error merging scopes: {e}.") from e
 
@@ -145,23 +153,13 @@ class ScopeStrategy(SimpleStrategy):
             Union[str, List[str]]: The processed scopes as a string or a list.
         Raises:
             ScopeStrategyError: If the input is not a string or list, or if it contains invalid elements.
-            ScopeStrategyExecutionError: If an error occurs during execution.
+            ScopeStrategyExecutionError: If an error occurs during splitting or merging.
             ScopeModeStrategyError: If the execution mode is invalid.
         """
-        try:
-            if mode == ScopeExecutionMode.SPLIT:
-                return self.split_scopes(scopes)
-            elif mode == ScopeExecutionMode.MERGE:
-                return self.merge_scopes(scopes)
-            elif mode == ScopeExecutionMode.DUAL:
-                if isinstance(scopes, str):
-                    return self.split_scopes(scopes)
-                elif isinstance(scopes, list):
-                    return self.merge_scopes(scopes)
-        except Exception as e:
-            if isinstance(e, ScopeStrategyError):
-                raise e
-            raise ScopeStrategyExecutionError(f"Error executing strategy: {e}.") from e
-
-        raise ScopeModeStrategyError(f"Invalid execution mode: {mode}.")
-
+        if mode == ScopeExecutionMode.DUAL:
+            method = "split_scopes" if isinstance(scopes, str) else "merge_scopes"
+        else:
+            method = self._DISPATCH.get(mode)
+            if method is None:
+                raise ScopeModeStrategyError(f"Invalid execution mode: {mode}.")
+        return getattr(self, method)(scopes)
@@ -1,42 +1,86 @@
 import logging
+import re
 from threading import Lock
-from typing import Tuple
+from typing import Any, Optional, Pattern, Set
 
 _secret_lock = Lock()
-_secrets: Tuple[str, ...] = ()
+_secrets: Set[str] = set()
+# Single alternation over all secrets, longest first so overlapping secrets are
+# fully masked. Rebuilt on registration; None while no secrets are registered.
+_secret_pattern: Optional[Pattern[str]] = None
 
 def register_secret(secret: str) -> None:
     """Add a secret to the global mask registry."""
-    global _secrets
+    global _secret_pattern
     with _secret_lock:
-        # dedupe and grow tuple
         if secret and secret not in _secrets:
-            _secrets = _secrets + (secret,)
+            _secrets.add(secret)
+            _secret_pattern = re.compile(
+                "|".join(re.escape(s) for s in sorted(_secrets, key=len, reverse=True))
+            )
 
-def _mask(text: str) -> str:
-    """Replace any occurrence of a registered secret with asterisks."""
-    for s in _secrets:
-        if s and s in text:
-            text = text.replace(s, "*" * len(s))
-    return text
+def _stars(match: "re.Match[str]") -> str:
+    """Replace a matched secret with asterisks of the same length."""
+    return "*" * len(match.group(0))
+
+def _mask_arg(pattern: Pattern[str], arg: Any) -> Any:
+    """Mask a formatting argument, returning it untouched if it holds no secret."""
+    text = arg if isinstance(arg, str) else str(arg)
+    masked = pattern.sub(_stars, text)
+    return arg if masked == text else masked
 
 class SecretFilter(logging.Filter):
     """Mask all registered secrets in every log record."""
     def filter(self, record: logging.LogRecord) -> bool:
-        # Sanitize the format string
-        record.msg = _mask(str(record.msg))
-        # Sanitize each argument
+        # Snapshot once per record; nothing to do until a secret is registered
+        pattern = _secret_pattern
+        if pattern is None:
+            return True
         if record.args:
-            # record.args might be a tuple or dict; handle both
-            if isinstance(record.args, tuple):
-                record.args = tuple(_mask(str(a)) for a in record.args)
-            elif isinstance(record.args, dict):
-                record.args = {k: _mask(str(v)) for k, v in record.args.items()}
+            try:
+                message = record.getMessage()
+            except Exception:
+                # Malformed record; mask the parts and let the handler report it
+                self._mask_parts(record, pattern)
+                return True
+            masked = pattern.sub(_stars, message)
+            if masked != message:
+                # Store the rendered, masked message so formatters do not
+                # re-render (and re-expose) the original args
+                record.msg = masked
+                record.args = ()
+            return True
+        msg = record.msg
+        record.msg = pattern.sub(_stars, msg if isinstance(msg, str) else str(msg))
         return True
 
+    @staticmethod
+    def _mask_parts(record: logging.LogRecord, pattern: Pattern[str]) -> None:
+        """Mask the format string and each argument separately."""
+        msg = record.msg
+        record.msg = pattern.sub(_stars, msg if isinstance(msg, str) else str(msg))
+        args = record.args
+        # record.args might be a tuple or dict; handle both
+        if isinstance(args, tuple):
+            masked = tuple(_mask_arg(pattern, a) for a in args)
+            if any(m is not a for m, a in zip(masked, args)):
+                record.args = masked
+        elif isinstance(args, dict):
+            record.args = {k: _mask_arg(pattern, v) for k, v in args.items()}
+
 def setup_secret_filter() -> None:
-    """Attach the SecretFilter to the root logger once."""
+    """
+    Attach the SecretFilter to every handler of the root logger once.
+
+    Handler filters see records propagated from every logger, and only after
+    level filtering. A filter on the root logger itself only sees records
+    logged directly on it. If the root logger has no handlers yet, the filter
+    goes on the root logger until handlers are configured and this is called
+    again.
+    """
     root = logging.getLogger()
-    # Avoid adding multiple times
-    if not any(isinstance(f, SecretFilter) for f in root.filters):
-        root.addFilter(SecretFilter())
+    targets = root.handlers or [root]
+    for target in targets:
+        # Avoid adding multiple times
+        if not any(isinstance(f, SecretFilter) for f in target.filters):
+            target.addFilter(SecretFilter())
@@ -0,0 +1,47 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise. Both paths produce bytes so callers can hand the result to httpx
+    as request content without another encode step.
+
+    Arguments:
+        obj (Any): The object to serialize.
+    Returns:
+        bytes: The JSON document.
+    """
+    if orjson is not None:
+        # Non-str keys are stringified like the stdlib does, so output does not
+        # depend on whether the optional dependency is installed.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise. Accepting bytes lets callers parse response content directly
+    instead of decoding it to text first.
+
+    Arguments:
+        data (Union[bytes, str]): The JSON document.
+    Returns:
+        Any: The deserialized object.
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,4 +1,5 @@
 import pytest
+import tests.test_client
 import tests.test_oauth2
 import tests.test_request_id
 
@@ -0,0 +1,188 @@
+import io
+import threading
+
+import httpx
+import pytest
+from httpx import URL
+
+from api_essentials.auth.config import OAuth2Config
+from api_essentials.auth.token import OAuth2Token
+from api_essentials.client import APIClient
+from api_essentials.strategy.strategies.cache import ResponseCache
+from api_essentials.strategy.strategies.coalesce import RequestCoalescer
+
+
+# -- Fixtures & Helpers ------------------------------------------------------
+
+@pytest.fixture
+def config():
+    return OAuth2Config(
+        client_id="cid",
+        client_secret="secret",
+        token_url=URL("https://example.com/token"),
+        access_token=OAuth2Token(access_token="tok", expires_in=3600),
+    )
+
+@pytest.fixture
+def calls():
+    return []
+
+@pytest.fixture
+def transport(calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path == "/nostore":
+            return httpx.Response(200, json={"n": len(calls)}, headers={"Cache-Control": "no-store"})
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"n": len(calls)})
+    return httpx.MockTransport(handler)
+
+class CountingLock:
+    """
+    Lock stand-in for RequestCoalescer that counts acquisitions. Every caller
+    takes the lock once to look up the in-flight request, so the count tells
+    when all of them are waiting on it.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._acquired = threading.Condition()
+        self.count = 0
+
+    def __enter__(self):
+        self._lock.acquire()
+        with self._acquired:
+            self.count += 1
+            self._acquired.notify_all()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+    def wait_for(self, count, timeout):
+        with self._acquired:
+            return self._acquired.wait_for(lambda: self.count >= count, timeout)
+
+def make_client(config, transport, **kwargs):
+    return APIClient(config, "https://api.example.com", transport=transport, **kwargs)
+
+# -- Request body ------------------------------------------------------------
+
+class TestRequestBody:
+    def test_json_body_is_sent(self, config, transport, calls):
+        client = make_client(config, transport)
+        client.post("/items", json={"a": [1, 2]})
+        assert calls[-1].content == b'{"a":[1,2]}'
+        assert calls[-1].headers["Content-Type"] == "application/json"
+        assert calls[-1].headers["Authorization"] == "Bearer tok"
+
+    def test_multipart_files_body_is_sent(self, config, transport, calls):
+        client = make_client(config, transport)
+        client.post("/upload", files={"f": io.BytesIO(b"hi")})
+        assert calls[-1].headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert b'name="f"' in calls[-1].content
+        assert b"hi" in calls[-1].content
+
+    def test_json_body_with_non_str_keys(self, config, transport, calls):
+        client = make_client(config, transport)
+        client.post("/items", json={1: "a"})
+        assert calls[-1].content == b'{"1":"a"}'
+
+    def test_json_body_keeps_caller_content_type(self, config, transport, calls):
+        client = make_client(config, transport)
+        client.request("PATCH", "/items", json={"a": 1}, headers={"Content-Type": "application/merge-patch+json"})
+        assert calls[-1].headers["Content-Type"] == "application/merge-patch+json"
+
+    def test_json_body_with_header_list(self, config, transport, calls):
+        client = make_client(config, transport)
+        client.post("/items", json={"a": 1}, headers=[("X-A", "1")])
+        assert calls[-1].headers["X-A"] == "1"
+        assert calls[-1].headers["Content-Type"] == "application/json"
+
+# -- Response cache ----------------------------------------------------------
+
+class TestResponseCache:
+    def test_get_served_from_cache(self, config, transport, calls):
+        client = make_client(config, transport, cache=ResponseCache(ttl=60))
+        first = client.get("/items")
+        second = client.get("/items")
+        assert len(calls) == 1
+        assert second is first
+
+    def test_cache_hit_does_not_count_against_rate_limit(self, config, transport, calls):
+        client = make_client(config, transport, cache=ResponseCache(ttl=60), max_requests=1)
+        client.get("/items")
+        client.get("/items")
+        assert len(calls) == 1
+
+    def test_post_not_cached(self, config, transport, calls):
+        client = make_client(config, transport, cache=ResponseCache(ttl=60))
+        client.post("/items", json={})
+        client.post("/items", json={})
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("path", ["/nostore", "/missing"])
+    def test_uncacheable_responses_not_stored(self, config, transport, calls, path):
+        client = make_client(config, transport, cache=ResponseCache(ttl=60))
+        client.get(path)
+        client.get(path)
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("cache_control", ["max-age=60, no-store", "max-age=abc, no-store", "no-cache, max-age=60"])
+    def test_no_store_wins_over_max_age(self, cache_control):
+        cache = ResponseCache(ttl=60)
+        assert cache._ttl_for(httpx.Response(200, headers={"Cache-Control": cache_control})) == 0
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(ttl=60, max_entries=1)
+        cache.set("a", httpx.Response(200))
+        cache.set("b", httpx.Response(200))
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=0)
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=1, max_entries=0)
+
+# -- Request coalescing ------------------------------------------------------
+
+class TestRequestCoalescing:
+    def test_concurrent_identical_gets_share_one_request(self, config, calls):
+        workers = 5
+        lock = CountingLock()
+        all_entered = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            # Hold the in-flight request until every worker has looked it up
+            all_entered.append(lock.wait_for(workers, timeout=5))
+            return httpx.Response(200, json={})
+
+        client = make_client(config, httpx.MockTransport(handler), coalesce_requests=True)
+        client.coalescer._lock = lock
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(client.get("/items"))) for _ in range(workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert all_entered == [True]
+        assert len(results) == workers
+        assert len(calls) == 1
+        assert not client.coalescer._inflight
+
+    def test_sequential_gets_not_coalesced(self, config, transport, calls):
+        client = make_client(config, transport, coalesce_requests=True)
+        client.get("/items")
+        client.get("/items")
+        assert len(calls) == 2
+
+    def test_exception_propagates_and_releases_key(self):
+        coalescer = RequestCoalescer()
+        def boom():
+            raise RuntimeError("boom")
+        with pytest.raises(RuntimeError):
+            coalescer.run("k", boom)
+        assert coalescer.run("k", lambda: 1) == 1
@@ -1,19 +1,23 @@
+import asyncio
+import pickle
 import pytest
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from httpx import URL, Client, AsyncClient, Request, Response
 
 import httpx
+import respx
 from api_essentials.auth.config import OAuth2Config, ConfigValidator
 from api_essentials.auth.grant_type import OAuth2GrantType
 from api_essentials.auth.oauth2 import BaseOAuth2, OAuth2ResponseType
 from api_essentials.auth.token import OAuth2Token, OAuthTokenType
-from api_essentials.utils.log import register_secret, SecretFilter
+from api_essentials.utils.log import register_secret, setup_secret_filter, SecretFilter
 
 
 # -- Fixtures & Helpers ------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dummy_url():
     return URL("https://example.com/token")
 
@@ -25,7 +29,7 @@ def basic_config(dummy_url):
         token_url=dummy_url,
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def token_data():
     return {
         "access_token": "abc123",
@@ -36,39 +40,26 @@ def token_data():
     }
 
 @pytest.fixture(autouse=True)
-def no_real_oauth_http(monkeypatch, token_data):
+def oauth_http(dummy_url, token_data):
     """
-    Globally stub out any httpx.Client.send or .post calls so that
-    request_new(), refresh(), and sync_auth_flow never hit the network.
+    Route every request to the token endpoint to a canned token response so
+    that request_new(), refresh(), and sync_auth_flow never hit the network.
     """
-
-    # A generic fake token response
-    def _fake_token_response(request: httpx.Request):
-        return httpx.Response(
-            200,
-            json=token_data,
-            request=request
+    with respx.mock(assert_all_called=False) as router:
+        router.post(str(dummy_url), name="token").mock(
+            return_value=httpx.Response(200, json=token_data)
         )
+        yield router
 
-    # Monkey-patch Client.send
-    def fake_send(self, request: httpx.Request, **kwargs):
-        return _fake_token_response(request)
-    monkeypatch.setattr(httpx.Client, "send", fake_send, raising=True)
-
-    # Monkey-patch Client.post (used in refresh())
-    def fake_post(self, url, *, data=None, **kwargs):
-        # Build a dummy Request so raise_for_status() will work
-        req = Request("POST", url, data=data, headers={})
-        return _fake_token_response(req)
-    monkeypatch.setattr(httpx.Client, "post", fake_post, raising=True)
-
-    # You can also patch AsyncClient if you ever do real async HTTP:
-    async def fake_async_send(self, request: httpx.Request, **kwargs):
-        return _fake_token_response(request)
-    monkeypatch.setattr(httpx.AsyncClient, "send", fake_async_send, raising=False)
-    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post, raising=False)
+@pytest.fixture(scope="session")
+def mock_transport(token_data):
+    """
+    Socket-free transport for tests that build their own clients, so no
+    connection pool or TLS context is created.
+    """
+    return httpx.MockTransport(lambda request: httpx.Response(200, json=token_data))
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def token(token_data):
     now = datetime.now()
     return OAuth2Token(
@@ -81,6 +72,15 @@ def token(token_data):
     )
 
 @pytest.fixture
+def expiring_token():
+    """Valid token that is 30 seconds into its prefetch window."""
+    return OAuth2Token(
+        access_token="old",
+        expires_in=3600,
+        created_at=datetime.now(tz=timezone.utc) - timedelta(seconds=3600 - 60 - 30),
+    )
+
+@pytest.fixture(scope="module")
 def expired_token(token_data):
     return OAuth2Token(
         access_token=token_data["access_token"],
@@ -128,6 +128,19 @@ class TestOAuth2ConfigProperties:
         assert basic_config._scope == ["x", "y"]
         assert "x" in basic_config.scope
 
+    def test_scope_is_deduplicated_in_order(self, basic_config):
+        basic_config.set_scope(["write", "read", "write", "admin"])
+        assert basic_config.scope == "write read admin"
+
+    def test_scope_string_tracks_changes(self, basic_config):
+        from api_essentials.strategy.strategies.scope_strategies import ScopeStrategy
+        basic_config.set_scope(["a", "b"])
+        assert basic_config.scope == "a b"
+        basic_config.add_scope("c")
+        assert basic_config.scope == "a b c"
+        basic_config.scope_strategy = ScopeStrategy(delimiter=",")
+        assert basic_config.scope == "a,b,c"
+
     def test_add_scope_appends(self, basic_config):
         basic_config._scope = ["a"]
         basic_config.add_scope("b")
@@ -158,12 +171,33 @@ class TestOAuth2Token:
     def test_is_expired_true(self, expired_token):
         assert expired_token.is_expired is True
 
+    def test_seconds_until_expiry_includes_grace_period(self, token, expired_token, monkeypatch):
+        assert expired_token.seconds_until_expiry < 0
+        # Pin the clock relative to the token, so the module-scoped fixture's age does not matter
+        now = token.expires_at - timedelta(seconds=token.grace_period + 10)
+        now_ns = (now - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1) * 1_000
+        monkeypatch.setattr(time, "time_ns", lambda: now_ns)
+        assert token.seconds_until_expiry == 10
+
     def test_is_valid(self, token):
         assert token.is_valid
 
     def test_is_revoked_default(self, token):
         assert token.is_revoked is False
 
+    def test_pickle_recomputes_expiry_deadline(self, token):
+        restored = pickle.loads(pickle.dumps(token))
+        assert restored == token
+        assert not restored.is_expired
+        assert restored.expires_at == token.expires_at
+
+    def test_expired_after_wall_clock_passes_deadline(self, token, monkeypatch):
+        # e.g. the machine was suspended past the token lifetime
+        resumed_at = token.expires_at + timedelta(seconds=1)
+        monkeypatch.setattr(time, "time_ns", lambda: int(resumed_at.timestamp() * 1_000_000_000))
+        assert token.is_expired
+        assert not token.is_valid
+
     def test_token_property(self, token):
         assert token.token == token.access_token
 
@@ -173,16 +207,11 @@ class TestOAuth2Token:
         assert new.access_token == token.access_token
         assert new.refresh_token == token.refresh_token
 
-    def test_request_new_invokes_httpx(self, basic_config, monkeypatch, token_data):
-        called = {}
-        def fake_send(self, request):
-            called['data'] = request.content.decode()
-            return Response(200, json=token_data, request=request)
-
-        monkeypatch.setattr(Client, "send", fake_send)
+    def test_request_new_invokes_httpx(self, basic_config, oauth_http, token_data):
         new = OAuth2Token.request_new(basic_config)
         assert new.access_token == token_data["access_token"]
-        assert basic_config._grant_type.value in called['data']
+        sent = oauth_http["token"].calls.last.request
+        assert basic_config._grant_type.value in sent.content.decode()
 
     def test_refresh_uses_request_new(self, basic_config, monkeypatch, token):
         monkeypatch.setattr(OAuth2Token, "request_new", lambda cfg: token)
@@ -193,8 +222,8 @@ class TestOAuth2Token:
 # -- BaseOAuth2 Integration --------------------------------------------------
 
 class TestBaseOAuth2:
-    def test_attach_client_sets_client(self, base_oauth, basic_config):
-        client = httpx.Client()
+    def test_attach_client_sets_client(self, base_oauth, basic_config, mock_transport):
+        client = httpx.Client(transport=mock_transport)
         basic_config.attach_client(client)
         assert basic_config.client is client
 
@@ -234,6 +263,15 @@ class TestBaseOAuth2:
         assert token_req.method == "GET"
         assert token_req.headers["Authorization"].startswith("Bearer ")
 
+    def test_bearer_header_cached_per_token(self, basic_config, token):
+        basic_config.access_token = token
+        oauth = BaseOAuth2(basic_config)
+        first = next(oauth.sync_auth_flow(Request("GET", "https://example.com")))
+        second = next(oauth.sync_auth_flow(Request("GET", "https://example.com")))
+        assert first.headers["Authorization"] == f"Bearer {token.access_token}"
+        assert oauth._bearer_cache[0] is token
+        assert second.headers["Authorization"] == first.headers["Authorization"]
+
     def test_code_flow_includes_redirect_uri(self, basic_config):
         basic_config.redirect_uri = URL("https://app/callback")
         basic_config.response_type = OAuth2ResponseType.CODE
@@ -285,6 +323,29 @@ class TestSecurityBestPractices:
         # validate that secret does not appear in logs
         assert basic_config.client_secret not in caplog.text
 
+    def test_mask_overlapping_secrets(self):
+        register_secret("tok")
+        register_secret("token-xyz")
+        record = logging.LogRecord("x", logging.INFO, __file__, 1, "a token-xyz and tok", None, None)
+        SecretFilter().filter(record)
+        assert record.getMessage() == "a ********* and ***"
+
+    def test_secret_filter_on_root_handlers(self):
+        root = logging.getLogger()
+        handler = logging.NullHandler()
+        root.addHandler(handler)
+        try:
+            setup_secret_filter()
+            assert any(isinstance(f, SecretFilter) for f in handler.filters)
+        finally:
+            root.removeHandler(handler)
+
+    def test_secret_filter_keeps_non_secret_args(self):
+        register_secret("hunter2")
+        record = logging.LogRecord("x", logging.INFO, __file__, 1, "%d %s", (42, "hunter2"), None)
+        SecretFilter().filter(record)
+        assert record.getMessage() == "42 *******"
+
     def test_token_is_frozen(self, token):
         with pytest.raises(Exception):
             setattr(token, "access_token", "new")
@@ -308,16 +369,76 @@ class TestEdgeCases:
 
 # -- Async Client Support ----------------------------------------------------
 
+@pytest.mark.asyncio
+class TestAsyncTokenPrefetch:
+    async def test_prefetch_replaces_expiring_token(self, basic_config, token_data, expiring_token):
+        basic_config.access_token = expiring_token
+        oauth = BaseOAuth2(basic_config)
+        flow = oauth.async_auth_flow(Request("GET", "https://example.com"))
+        authed = await flow.__anext__()
+        assert authed.headers["Authorization"] == "Bearer old"
+        assert oauth._refresh_task is not None
+        await oauth._refresh_task
+        assert basic_config.access_token.access_token == token_data["access_token"]
+        assert oauth._refresh_task is None
+
+    async def test_failed_prefetch_backs_off(self, basic_config, oauth_http, expiring_token):
+        oauth_http["token"].mock(return_value=httpx.Response(500))
+        basic_config.access_token = expiring_token
+        oauth = BaseOAuth2(basic_config)
+        await oauth.async_auth_flow(Request("GET", "https://example.com")).__anext__()
+        await asyncio.wait((oauth._refresh_task,))
+        for _ in range(5):
+            await oauth.async_auth_flow(Request("GET", "https://example.com")).__anext__()
+        assert oauth._refresh_task is None
+        assert oauth_http["token"].call_count == 1
+
+    async def test_expired_token_waits_for_inflight_prefetch(self, basic_config, oauth_http, token_data, expiring_token):
+        basic_config.access_token = expiring_token
+        oauth = BaseOAuth2(basic_config)
+        await oauth.async_auth_flow(Request("GET", "https://example.com")).__anext__()
+        prefetch = oauth._refresh_task
+        assert prefetch is not None
+        basic_config.access_token = OAuth2Token(
+            access_token="expired", expires_in=1,
+            created_at=datetime.now(tz=timezone.utc) - timedelta(seconds=60),
+        )
+        authed = await oauth.async_auth_flow(Request("GET", "https://example.com")).__anext__()
+        await asyncio.wait((prefetch,))
+        assert authed.headers["Authorization"] == f"Bearer {token_data['access_token']}"
+        assert oauth_http["token"].call_count == 1
+
+    async def test_no_prefetch_with_attached_client(self, basic_config, mock_transport, expiring_token):
+        basic_config.access_token = expiring_token
+        basic_config.attach_client(httpx.Client(transport=mock_transport))
+        oauth = BaseOAuth2(basic_config)
+        await oauth.async_auth_flow(Request("GET", "https://example.com")).__anext__()
+        assert oauth._refresh_task is None
+
+    async def test_no_prefetch_for_fresh_token(self, basic_config, token):
+        basic_config.access_token = token
+        oauth = BaseOAuth2(basic_config)
+        await oauth.async_auth_flow(Request("GET", "https://example.com")).__anext__()
+        assert oauth._refresh_task is None
+
+
+def test_prefetch_skipped_without_asyncio_loop(basic_config, expiring_token):
+    basic_config.access_token = expiring_token
+    oauth = BaseOAuth2(basic_config)
+    oauth._schedule_prefetch()  # no running asyncio loop, as under trio
+    assert oauth._refresh_task is None
+
+
 @pytest.mark.asyncio
 class TestAsyncClientSupport:
-    async def test_attach_client_async(self, basic_config):
-        async_client = AsyncClient()
+    async def test_attach_client_async(self, basic_config, mock_transport):
+        async_client = AsyncClient(transport=mock_transport)
         oauth = BaseOAuth2(basic_config)
         basic_config.attach_client(async_client)
         assert basic_config.client is async_client
 
-    async def test_async_flow_raises_if_sync_used(self, basic_config):
-        async_client = AsyncClient()
+    async def test_async_flow_raises_if_sync_used(self, basic_config, mock_transport):
+        async_client = AsyncClient(transport=mock_transport)
         oauth = BaseOAuth2(basic_config)
         basic_config.attach_client(async_client)
         req = Request("GET", "https://example.com")
@@ -1,4 +1,5 @@
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 
 import pytest
@@ -7,6 +8,12 @@ import uuid
 from api_essentials.models.request import RequestId
 
 
+@pytest.fixture(scope="session")
+def pool():
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        yield executor
+
+
 class SampleClass:
     request_id = RequestId()
 
@@ -29,6 +36,19 @@ def test_request_id_descriptor_access_from_class():
     assert isinstance(SampleClass.request_id, uuid.UUID)
 
 
+def test_request_id_on_slotted_owner():
+    class SlottedClass:
+        __slots__ = ("_SlottedClass__request_id",)
+        request_id = RequestId()
+
+    instance = SlottedClass()
+    rid = instance.request_id
+    assert isinstance(rid, uuid.UUID)
+    assert instance.request_id == rid
+    SlottedClass.__dict__['request_id']._reset(instance)
+    assert instance.request_id != rid
+
+
 def test_setting_request_id_raises_attribute_error():
     instance = SampleClass()
     with pytest.raises(AttributeError, match="Cannot set request ID directly."):
@@ -68,15 +88,6 @@ def test_request_id_inject_raises():
     with pytest.raises(AttributeError):
         SampleClass.__dict__['request_id'].inject(instance, uuid.uuid4())
 
-def test_request_id_thread_safety():
-    import threading
-    ids = []
-    def get_id():
-        instance = SampleClass()
-        ids.append(instance.request_id)
-    threads = [threading.Thread(target=get_id) for _ in range(10)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+def test_request_id_thread_safety(pool):
+    ids = list(pool.map(lambda _: SampleClass().request_id, range(10)))
     assert len(set(ids)) == 10